@@ -1,11 +1,17 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import sys
 import os
-import google.generativeai as genai
+import copy
+import functools
+import io
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -14,15 +20,37 @@ load_dotenv()
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.data_handler import ExcelParser, ExcelWriter, Intern
-from src.scheduler import SchedulerWithRelaxation
+from src.data_handler import ExcelParser, Intern, schedule_blocks
+from src.scheduler import SchedulerWithRelaxation, ScheduleSolution
 from src.validator import ScheduleValidator
 from src.bottleneck_analyzer import BottleneckAnalyzer
-from src.visual_timeline import TimelineVisualizer
-from src.audit_export import generate_quick_audit_report
 import src.config as config
 from src.config import ProgramConfiguration
 
+# Station metadata as parallel arrays, indexed by position in STATIONS_MODEL_A
+_STATION_KEYS = list(config.STATIONS_MODEL_A)
+_KEY2IDX = {key: idx for idx, key in enumerate(_STATION_KEYS)}
+_STATION_NAMES = np.array([config.STATIONS_MODEL_A[key].name for key in _STATION_KEYS])
+_STATION_MAX = np.array([config.STATIONS_MODEL_A[key].max_interns for key in _STATION_KEYS], dtype=np.int32)
+
+_STATIONS_BY_MODEL = {'A': config.STATIONS_MODEL_A, 'B': config.STATIONS_MODEL_B}
+
+# Normalized station name -> key per model, for matching editor input
+_NAME_TO_KEY = {
+    model: {station.name.strip().lower(): station_key for station_key, station in stations.items()}
+    for model, stations in _STATIONS_BY_MODEL.items()
+}
+
+# Lowercased station names per model, in config order, for partial matching
+_LOWER_NAMES = {
+    model: [(station.name.lower(), station_key) for station_key, station in stations.items()]
+    for model, stations in _STATIONS_BY_MODEL.items()
+}
+
+# Fixed color per station name, shared by the Gantt and capacity charts
+_PALETTE = {name: px.colors.qualitative.Alphabet[idx % len(px.colors.qualitative.Alphabet)]
+            for idx, name in enumerate(_STATION_NAMES)}
+
 # Page configuration
 st.set_page_config(
     page_title="ResiPlanAI - Residency Scheduler",
@@ -70,34 +98,48 @@ if 'current_date' not in st.session_state:
     st.session_state.current_date = datetime.now()
 if 'schedule_generated' not in st.session_state:
     st.session_state.schedule_generated = False
-if 'edited_df' not in st.session_state:
-    st.session_state.edited_df = None
+if 'saved_editor_signature' not in st.session_state:
+    st.session_state.saved_editor_signature = None
+if 'save_report' not in st.session_state:
+    st.session_state.save_report = None  # Editor save results shown after the full rerun
 if 'messages' not in st.session_state:
     st.session_state.messages = []
 if 'bottleneck_summary' not in st.session_state:
     st.session_state.bottleneck_summary = None
 if 'program_config' not in st.session_state:
     st.session_state.program_config = ProgramConfiguration()
+if 'solve_future' not in st.session_state:
+    st.session_state.solve_future = None
+if 'solve_fingerprint' not in st.session_state:
+    st.session_state.solve_fingerprint = None  # Interns fingerprint the running solve started from
+if 'scheduler_executor' not in st.session_state:
+    st.session_state.scheduler_executor = None
+if 'scheduler_status' not in st.session_state:
+    st.session_state.scheduler_status = None
+if 'start_month' not in st.session_state:
+    st.session_state.start_month = None  # Earliest intern start_date; None = recompute
 
 # Helper Functions
+@st.cache_data(max_entries=4, show_spinner=False)
+def _parse_bytes(file_bytes, current_date_iso):
+    """Parse uploaded Excel bytes in memory; cached so reloading the same file skips parsing."""
+    parser = ExcelParser()
+    return parser.parse_excel(io.BytesIO(file_bytes), datetime.fromisoformat(current_date_iso))
+
 def parse_uploaded_file(uploaded_file, current_date):
     """Parse uploaded Excel file and return list of Intern objects."""
     try:
-        # Save uploaded file temporarily
-        temp_path = f"temp_{uploaded_file.name}"
-        with open(temp_path, "wb") as f:
-            f.write(uploaded_file.getbuffer())
-        
-        parser = ExcelParser()
-        interns = parser.parse_excel(temp_path, current_date)
-        
-        # Clean up temp file
-        os.remove(temp_path)
-        
+        interns = _parse_bytes(uploaded_file.getvalue(), current_date.isoformat())
         return interns, None
     except Exception as e:
         return None, str(e)
 
+@functools.lru_cache(maxsize=None)
+def _station_name(model, station_key):
+    """Display name of a station for a model ('A' or 'B'); unknown keys are shown as-is."""
+    station = _STATIONS_BY_MODEL['A' if model == 'A' else 'B'].get(station_key)
+    return station.name if station is not None else str(station_key)
+
 def interns_to_dataframe(interns):
     """
     Convert list of Intern objects to DataFrame for display/editing.
@@ -106,122 +148,73 @@ def interns_to_dataframe(interns):
     if not interns:
         return pd.DataFrame()
     
-    # Find the date range across ALL interns
-    all_dates = set()
-    for intern in interns:
-        for month_idx in intern.assignments.keys():
-            date = intern.get_month_date(month_idx)
-            all_dates.add((date.year, date.month))
+    # Find the date range across ALL interns (month_idx -> date is 30 days per month)
+    offsets = np.fromiter((month_idx for intern in interns for month_idx in intern.assignments),
+                          dtype=np.int64)
     
-    if not all_dates:
+    if not offsets.size:
         return pd.DataFrame()
     
-    # Create sorted list of dates
-    sorted_dates = sorted(all_dates)
-    date_strings = [f"{year}-{month:02d}" for year, month in sorted_dates]
+    starts = np.repeat(np.array([intern.start_date for intern in interns], dtype='datetime64[D]'),
+                       [len(intern.assignments) for intern in interns])
+    all_months = np.unique((starts + offsets * np.timedelta64(30, 'D')).astype('datetime64[M]'))
+    
+    # Sorted calendar months as labels and month numbers (months since 1970-01)
+    date_strings = np.datetime_as_string(all_months, unit='M').astype(object)
+    month_nums = all_months.astype(np.int64)
+    timeline = all_months.astype('datetime64[us]')
     
     # Build DataFrame with individual timelines
     data = {}
     data['Month'] = date_strings
     
     for intern in interns:
-        stations = config.STATIONS_MODEL_A if intern.model == 'A' else config.STATIONS_MODEL_B
-        intern_schedule = []
-        
-        # For each date in the global timeline
-        for year, month in sorted_dates:
-            current_date = datetime(year, month, 1)
+        column = np.full(len(all_months), "", dtype=object)
+        
+        if intern.assignments:
+            # Row of each assignment: month_idx is relative to THIS intern's
+            # start month; rows missing from the range or dated before the
+            # intern started stay empty
+            targets = (np.datetime64(intern.start_date, 'M').astype(np.int64) +
+                       np.fromiter(intern.assignments.keys(), dtype=np.int64, count=len(intern.assignments)))
+            rows = np.minimum(np.searchsorted(month_nums, targets), len(month_nums) - 1)
+            valid = (month_nums[rows] == targets) & (timeline[rows] >= np.datetime64(intern.start_date, 'us'))
             
-            # Calculate what month_idx this corresponds to for THIS intern
-            if current_date < intern.start_date:
-                # This date is before intern started
-                intern_schedule.append("")
-            else:
-                # Calculate month_idx relative to intern's start_date
-                month_diff = (current_date.year - intern.start_date.year) * 12 + (current_date.month - intern.start_date.month)
-                
-                if month_diff in intern.assignments:
-                    station_key = intern.assignments[month_diff]
-                    station_obj = stations.get(station_key)
-                    if station_obj:
-                        station_name = station_obj.name if hasattr(station_obj, 'name') else str(station_key)
-                    else:
-                        station_name = str(station_key)
-                    intern_schedule.append(station_name)
-                else:
-                    # This date is in intern's timeline but no assignment
-                    intern_schedule.append("")
+            labels = np.array([_station_name(intern.model, station_key) for station_key in intern.assignments.values()],
+                              dtype=object)
+            column[rows[valid]] = labels[valid]
         
-        data[intern.name] = intern_schedule
+        data[intern.name] = column
     
-    return pd.DataFrame(data)
+    # Arrow-backed strings serialize to the data editor without a per-cell
+    # conversion (pandas 2 would otherwise keep these as object columns)
+    return pd.DataFrame(data, copy=False).astype("string[pyarrow]")
+
+def _interns_fingerprint(interns):
+    """
+    Hashable snapshot of the intern fields read by the charts.
+    Used as the st.cache_data key so cached figures follow schedule edits.
+    """
+    return tuple(
+        (intern.name, intern.model, intern.department, intern.start_date,
+         intern.total_months, tuple(sorted(intern.assignments.items())))
+        for intern in interns
+    )
 
-def create_gantt_chart(interns):
+def create_gantt_chart(interns, window=None):
     """
     Create interactive Gantt chart for God View.
     Sorted by start_date: newest interns (latest start_date) at top, oldest at bottom.
+    window: optional (start, end) datetimes; blocks entirely outside it are not drawn.
     """
     if not interns:
         return go.Figure()
     
     # Sort interns by start_date descending (newest first)
     sorted_interns = sorted(interns, key=lambda x: x.start_date, reverse=True)
+    scheduled = [intern for intern in sorted_interns if intern.assignments]
     
-    df_data = []
-    
-    for intern in sorted_interns:
-        stations = config.STATIONS_MODEL_A if intern.model == 'A' else config.STATIONS_MODEL_B
-        
-        # Group consecutive months with same station
-        if not intern.assignments:
-            continue
-        
-        current_station = None
-        start_month = None
-        
-        for month_idx in sorted(intern.assignments.keys()):
-            station_key = intern.assignments[month_idx]
-            
-            if station_key != current_station:
-                # Save previous block
-                if current_station is not None:
-                    station_obj = stations.get(current_station)
-                    station_name = station_obj.name if station_obj else current_station
-                    
-                    start_date = intern.start_date + timedelta(days=30 * start_month)
-                    end_date = intern.start_date + timedelta(days=30 * month_idx)
-                    
-                    df_data.append({
-                        'Intern': intern.name,
-                        'Station': station_name,
-                        'Start': start_date,
-                        'End': end_date,
-                        'Department': intern.department,
-                        'StartDate': intern.start_date  # For sorting reference
-                    })
-                
-                # Start new block
-                current_station = station_key
-                start_month = month_idx
-        
-        # Add final block
-        if current_station is not None:
-            station_obj = stations.get(current_station)
-            station_name = station_obj.name if station_obj else current_station
-            
-            start_date = intern.start_date + timedelta(days=30 * start_month)
-            end_date = intern.start_date + timedelta(days=30 * (month_idx + 1))
-            
-            df_data.append({
-                'Intern': intern.name,
-                'Station': station_name,
-                'Start': start_date,
-                'End': end_date,
-                'Department': intern.department,
-                'StartDate': intern.start_date  # For sorting reference
-            })
-    
-    if not df_data:
+    if not scheduled:
         fig = go.Figure()
         fig.add_annotation(text="No schedule data available",
                           xref="paper", yref="paper",
@@ -229,22 +222,77 @@ def create_gantt_chart(interns):
                           font=dict(size=20, color="gray"))
         return fig
     
-    df = pd.DataFrame(df_data)
+    # All assignments are flattened and factorized in one pass
+    counts = [len(intern.assignments) for intern in scheduled]
+    rows = np.repeat(np.arange(len(scheduled)), counts)
+    months = np.fromiter((month_idx for intern in scheduled for month_idx in intern.assignments),
+                         dtype=np.int64, count=sum(counts))
+    codes, station_keys = pd.factorize(pd.Series(
+        [station_key for intern in scheduled for station_key in intern.assignments.values()], dtype=object))
+    
+    # Group consecutive months with same station; unassigned gaps are bridged
+    firsts, block_start, block_end = schedule_blocks(rows, months, codes)
+    block_rows = rows[firsts]
+    block_codes = codes[firsts]
+    
+    names_a = np.array([_station_name('A', k) for k in station_keys], dtype=object)
+    names_b = np.array([_station_name('B', k) for k in station_keys], dtype=object)
+    is_model_a = np.array([intern.model == 'A' for intern in scheduled])
+    
+    intern_names = np.array([intern.name for intern in scheduled], dtype=object)
+    departments = np.array([intern.department for intern in scheduled], dtype=object)
+    start_dates = np.array([intern.start_date for intern in scheduled], dtype='datetime64[D]')
+    month = np.timedelta64(30, 'D')
+    
+    df = pd.DataFrame({
+        'Intern': intern_names[block_rows],
+        'Station': np.where(is_model_a[block_rows], names_a[block_codes], names_b[block_codes]),
+        'Start': start_dates[block_rows] + block_start * month,
+        'End': start_dates[block_rows] + block_end * month,
+        'Department': departments[block_rows],
+        'StartDate': start_dates[block_rows]  # For sorting reference
+    })
+    
+    if window is not None:
+        # Only send blocks overlapping the visible window to the browser
+        df = df[(df['End'] > window[0]) & (df['Start'] < window[1])]
     
     # Create custom category order (newest to oldest)
     intern_order = [intern.name for intern in sorted_interns]
     
-    fig = px.timeline(df, x_start="Start", x_end="End", y="Intern", color="Station",
-                      title="God View Matrix - Individual Timelines (Newest → Oldest)")
+    # One horizontal bar trace per station (bars positioned by base + duration),
+    # built directly instead of going through px.timeline
+    durations_ms = (df['End'] - df['Start']).dt.total_seconds() * 1000
+    
+    fig = go.Figure()
+    for station_name, blocks in df.groupby('Station', sort=False):
+        fig.add_trace(go.Bar(
+            name=station_name,
+            y=blocks['Intern'],
+            base=blocks['Start'],
+            x=durations_ms[blocks.index],
+            orientation='h',
+            marker_color=_PALETTE.get(station_name),
+            customdata=np.column_stack([blocks['End'].dt.strftime('%b %Y'), blocks['Department']]),
+            hovertemplate=("<b>%{y}</b><br>" + station_name +
+                           "<br>Start: %{base|%b %Y}<br>End: %{customdata[0]}"
+                           "<br>Department: %{customdata[1]}<extra></extra>")
+        ))
     
     # Set custom y-axis category order (maintains sort by start_date descending)
     fig.update_yaxes(categoryorder="array", categoryarray=intern_order)
+    fig.update_xaxes(type='date', range=list(window) if window is not None else None)
     fig.update_layout(
+        title="God View Matrix - Individual Timelines (Newest → Oldest)",
+        barmode='overlay',
+        bargap=0.1,
         height=max(400, len(interns) * 40),
         xaxis_title="Timeline",
         yaxis_title="Residents",
         showlegend=True,
-        hovermode='closest'
+        hovermode='closest',
+        uirevision='gantt' if window is None else f"gantt-{window[0]:%Y}-{window[1]:%Y}",  # Keep zoom/legend state across reruns
+        transition_duration=0
     )
     
     return fig
@@ -254,41 +302,38 @@ def create_capacity_chart(interns):
     if not interns:
         return go.Figure()
     
-    max_months = max(intern.total_months for intern in interns)
-    capacity_data = []
+    max_months = min(max(intern.total_months for intern in interns), 24)  # Show first 24 months
     
-    for month_idx in range(min(max_months, 24)):  # Show first 24 months
-        month_date = interns[0].start_date + timedelta(days=30 * month_idx)
-        month_label = month_date.strftime("%Y-%m")
-        
-        # Count interns per station
-        station_counts = {}
-        for intern in interns:
-            if month_idx in intern.assignments:
-                station_key = intern.assignments[month_idx]
-                station_counts[station_key] = station_counts.get(station_key, 0) + 1
-        
-        # Calculate capacity usage
-        for station_key, count in station_counts.items():
-            station = config.STATIONS_MODEL_A.get(station_key)
-            if station:
-                usage_pct = (count / station.max_interns * 100) if station.max_interns > 0 else 0
-                capacity_data.append({
-                    'Month': month_label,
-                    'Station': station.name,
-                    'Usage %': usage_pct,
-                    'Count': count,
-                    'Max': station.max_interns
-                })
+    # (intern x month) station indices; unknown stations are -1 and skipped
+    codes = np.array([intern.assignment_array(_KEY2IDX, max_months) for intern in interns])
+    assigned = codes >= 0
     
-    if not capacity_data:
+    if not assigned.any():
         return go.Figure()
     
-    df = pd.DataFrame(capacity_data)
+    # Count interns per (month, station) cell
+    n_stations = len(_STATION_KEYS)
+    months = np.nonzero(assigned)[1]
+    cells = np.bincount(months * n_stations + codes[assigned],
+                        minlength=max_months * n_stations)
+    month_col, station_col = np.divmod(np.flatnonzero(cells), n_stations)
+    
+    # Calculate capacity usage
+    df = pd.DataFrame({
+        'MonthIdx': month_col,
+        'Station': _STATION_NAMES[station_col],
+        'Count': cells[cells > 0],
+        'Max': _STATION_MAX[station_col],
+    })
+    
+    df['Usage %'] = (df['Count'] / df['Max'].where(df['Max'] > 0) * 100).fillna(0)
+    month_labels = pd.date_range(interns[0].start_date, periods=max_months, freq='30D').strftime("%Y-%m")
+    df['Month'] = month_labels[df['MonthIdx'].to_numpy()]
     
     fig = px.bar(df, x='Month', y='Usage %', color='Station',
                  title="Station Capacity Usage (%)",
                  barmode='group',
+                 color_discrete_map=_PALETTE,
                  hover_data=['Count', 'Max'])
     
     fig.add_hline(y=100, line_dash="dash", line_color="red", 
@@ -297,44 +342,217 @@ def create_capacity_chart(interns):
     
     return fig
 
-def run_scheduler(interns, current_date, time_limit):
+@st.cache_data(ttl=600, max_entries=8, show_spinner=False)
+def _editor_frame(interns_fingerprint, _interns):
+    """Cached interns_to_dataframe for the Tab 2 editor's source data."""
+    return interns_to_dataframe(_interns)
+
+@st.cache_data(ttl=600, max_entries=8, show_spinner=False)
+def _gantt_figure(interns_fingerprint, window, _interns):
+    """Cached create_gantt_chart; reruns only when the fingerprint or window changes."""
+    return create_gantt_chart(_interns, window)
+
+@st.cache_data(ttl=600, max_entries=8, show_spinner=False)
+def _capacity_figure(interns_fingerprint, _interns):
+    """Cached create_capacity_chart; reruns only when the fingerprint changes."""
+    return create_capacity_chart(_interns)
+
+@st.cache_data(ttl=600, max_entries=8, show_spinner=False)
+def _bottleneck_analysis(interns_fingerprint, _interns, lookahead_months=12):
+    """Cached BottleneckAnalyzer.analyze; reruns only when the fingerprint changes."""
+    return BottleneckAnalyzer(_interns, lookahead_months=lookahead_months).analyze()
+
+def _config_signature(program_config):
+    """Hashable snapshot of a session's program rules, for cache keys."""
+    return repr(program_config.get_config())
+
+@st.cache_data(ttl=600, max_entries=8, show_spinner=False)
+def _schedule_validation(interns_fingerprint, current_date, config_signature, _interns, _program_config):
+    """
+    Cached ScheduleValidator.validate (without AI) for the schedule, date and
+    program rules (config_signature of _program_config).
+    """
+    validator = ScheduleValidator(_interns, use_ai=False, program_config=_program_config)
+    return validator.validate(current_date=current_date)
+
+@st.cache_data(ttl=600, max_entries=8, show_spinner=False)
+def _bottleneck_issues(interns_fingerprint, _analysis):
+    """
+    Flatten a bottleneck analysis into one row per issue (1-based Month).
+    Missing deficit/excess values are 'N/A'. Shared by the Tab 3 critical
+    issues list and the detailed report table.
+    """
+    rows = [(bottleneck['month'] + 1, issue['station'], issue['type'], issue['severity'],
+             issue.get('deficit', 'N/A'), issue.get('excess', 'N/A'))
+            for bottleneck in _analysis['bottlenecks']
+            for issue in bottleneck['issues']]
+    
+    df = pd.DataFrame.from_records(rows, columns=['Month', 'Station', 'Type', 'Severity', 'Deficit', 'Excess'])
+    df['Month'] = df['Month'].astype(np.int32)
+    df['Details'] = "Deficit: " + df['Deficit'].astype(str) + ", Excess: " + df['Excess'].astype(str)
+    
+    return df
+
+class _NoSolution(Exception):
+    """Raised by _solve for runs without a feasible schedule, so they are never cached."""
+    
+    def __init__(self, status, solve_time):
+        super().__init__(status)
+        self.status = status
+        self.solve_time = solve_time
+
+@st.cache_resource(ttl=3600, max_entries=8, show_spinner=False)
+def _solve(intern_sig, current_date_iso, start_month_iso, time_limit, num_workers, _interns):
+    """
+    Run the relaxation scheduler once per distinct input.
+    Returns (status, solve_time, assignments, solved_at) so a cache hit can be
+    replayed onto the interns currently in session state. Infeasible or
+    timed-out runs raise _NoSolution instead, so the next click retries CP-SAT.
+    """
+    scheduler = SchedulerWithRelaxation(
+        interns=_interns,
+        current_date=datetime.fromisoformat(current_date_iso),
+        start_month=datetime.fromisoformat(start_month_iso),
+        time_limit_seconds=time_limit,
+        num_workers=num_workers
+    )
+    
+    solution = scheduler.solve_with_relaxation()
+    if not solution.is_feasible:
+        raise _NoSolution(solution.status, solution.solve_time)
+    
+    assignments = tuple(tuple(intern.assignments.items()) for intern in _interns)
+    return solution.status, solution.solve_time, assignments, time.monotonic()
+
+def program_start_month():
+    """Earliest intern start_date, computed once per intern list and kept in session state."""
+    if st.session_state.start_month is None:
+        st.session_state.start_month = min(intern.start_date for intern in st.session_state.interns)
+    return st.session_state.start_month
+
+def run_scheduler(interns, current_date, start_month, time_limit, num_workers=None):
     """Run the AI scheduler."""
     try:
-        start_month = min(intern.start_date for intern in interns)
+        intern_sig = (_interns_fingerprint(interns),
+                      tuple(intern.current_month_index for intern in interns))
         
-        scheduler = SchedulerWithRelaxation(
-            interns=interns,
-            current_date=current_date,
-            start_month=start_month,
-            time_limit_seconds=time_limit
-        )
+        requested_at = time.monotonic()
+        try:
+            status, solve_time, assignments, solved_at = _solve(intern_sig, current_date.isoformat(),
+                                                                start_month.isoformat(), time_limit,
+                                                                num_workers, interns)
+        except _NoSolution as e:
+            return ScheduleSolution(interns, e.status, e.solve_time), None
+        
+        for intern, intern_assignments in zip(interns, assignments):
+            intern.assignments = dict(intern_assignments)
         
-        solution = scheduler.solve_with_relaxation()
+        # Solved before this call started = served from the cache
+        solution = ScheduleSolution(interns, status, solve_time, from_cache=solved_at < requested_at)
         
         return solution, None
     except Exception as e:
         return None, str(e)
 
-def sync_editor_changes(edited_df):
+def _scheduler_executor():
+    """This session's worker thread for background scheduler runs, created on first use."""
+    if st.session_state.scheduler_executor is None:
+        st.session_state.scheduler_executor = ThreadPoolExecutor(max_workers=1)
+    return st.session_state.scheduler_executor
+
+@st.fragment(run_every=2)
+def scheduler_progress():
+    """Poll the background scheduler run and apply its result once it finishes."""
+    future = st.session_state.solve_future
+    
+    if not future.done():
+        st.info("⏳ Running AI scheduler... This may take a few minutes.")
+        return
+    
+    st.session_state.solve_future = None
+    solution, error = future.result()
+    
+    if error:
+        st.session_state.scheduler_status = ('error', f"Scheduler error: {error}")
+    elif _interns_fingerprint(st.session_state.interns) != st.session_state.solve_fingerprint:
+        # The schedule was edited, extended or reloaded while solving; don't overwrite it
+        st.session_state.scheduler_status = ('warning', "⚠️ Schedule changed while the scheduler was running. "
+                                                        "Result discarded - run the scheduler again.")
+    elif solution and solution.is_feasible:
+        # Copy solved assignments back by name; the run worked on a snapshot
+        solved = {intern.name: intern.assignments for intern in solution.interns}
+        for intern in st.session_state.interns:
+            if intern.name in solved:
+                intern.assignments = dict(solved[intern.name])
+        
+        st.session_state.schedule_generated = True
+        if solution.from_cache:
+            st.session_state.scheduler_status = ('success', "✅ Schedule generated! (reused an identical earlier run)")
+        else:
+            st.session_state.scheduler_status = ('success', f"✅ Schedule generated! ({solution.solve_time:.1f}s)")
+    else:
+        st.session_state.scheduler_status = ('error', "❌ Could not find valid solution")
+    
+    # Full rerun so every tab picks up the new schedule
+    st.rerun()
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_station_key(model, station_name_normalized):
+    """
+    Match a normalized editor cell value to a station key for the given model:
+    exact name first, then the first station whose name contains the value or
+    is contained in it. Returns None if nothing matches.
+    """
+    station_key = _NAME_TO_KEY[model].get(station_name_normalized)
+    if station_key is not None:
+        return station_key
+    
+    return next((key for name, key in _LOWER_NAMES[model]
+                 if station_name_normalized in name or name in station_name_normalized), None)
+
+def _neg_delta(count):
+    """st.metric delta for a count where any value above zero is bad."""
+    return f"-{count}" if count else None
+
+def _messages_frame(messages, message_type):
+    """
+    Table of validation messages: 'Intern: description' is split on the first
+    colon; messages without one are listed under 'General'.
+    """
+    s = pd.Series(messages)
+    parts = s.str.partition(':')
+    has_intern = parts[1] == ':'
+    
+    return pd.DataFrame({
+        "Intern": parts[0].str.strip().where(has_intern, "General"),
+        "Type": message_type,
+        "Description": parts[2].str.strip().where(has_intern, s)
+    })
+
+def _capped_dataframe(df, height, max_rows=500):
+    """st.dataframe that sends at most max_rows rows to the browser."""
+    if len(df) > max_rows:
+        st.caption(f"Showing first {max_rows:,} of {len(df):,} rows")
+        df = df.head(max_rows)
+    st.dataframe(df, use_container_width=True, height=height)
+
+def _frame_signature(df):
+    """Cheap content signature of a DataFrame: column labels plus a summed row hash."""
+    row_hashes = pd.util.hash_pandas_object(df, index=True, categorize=False).to_numpy()
+    return tuple(df.columns), int(row_hashes.sum())
+
+def sync_editor_changes(edited_df, original_df=None):
     """
     Sync changes from data editor back to Intern objects in session state.
     Now handles individual intern timelines based on their start_date.
+    If original_df (the data the editor started from) is given, only cells that
+    differ from it are synced.
     Returns (success, message, updated_count).
     """
     try:
         updated_count = 0
         errors = []
         
-        # Build station name to key mappings for both models
-        station_name_to_key_a = {}
-        station_name_to_key_b = {}
-        
-        for station_key, station in config.STATIONS_MODEL_A.items():
-            station_name_to_key_a[station.name.strip().lower()] = station_key
-        
-        for station_key, station in config.STATIONS_MODEL_B.items():
-            station_name_to_key_b[station.name.strip().lower()] = station_key
-        
         # Parse dates from Month column
         if 'Month' not in edited_df.columns:
             return False, "Month column missing from edited data", 0
@@ -347,61 +565,69 @@ def sync_editor_changes(edited_df):
             except:
                 dates.append(None)
         
+        # Row dates and calendar month numbers; unparseable rows become NaT
+        row_dates = np.array(dates, dtype='datetime64[D]')
+        row_months = row_dates.astype('datetime64[M]').astype(np.int64)
+        
+        # Edited cells mask; None means every cell is synced
+        changed = None
+        if original_df is not None and original_df.columns.equals(edited_df.columns) and len(original_df) == len(edited_df):
+            edited_values = edited_df.to_numpy(dtype=object, na_value=None)
+            original_values = original_df.to_numpy(dtype=object, na_value=None)
+            changed = (edited_values != original_values) & ~(pd.isna(edited_values) & pd.isna(original_values))
+        
         # Iterate through each intern in session state
         for intern in st.session_state.interns:
             if intern.name not in edited_df.columns:
                 continue
             
-            # Get appropriate station mapping for this intern's model
-            station_mapping = station_name_to_key_a if intern.model == 'A' else station_name_to_key_b
-            stations_config = config.STATIONS_MODEL_A if intern.model == 'A' else config.STATIONS_MODEL_B
+            # Station lookups depend on this intern's model
+            model = 'A' if intern.model == 'A' else 'B'
             
-            # Update assignments for each date in the DataFrame
-            changes_made = False
-            for row_idx, (current_date, station_name) in enumerate(zip(dates, edited_df[intern.name])):
-                if current_date is None:
-                    continue
-                
-                # Calculate month_idx relative to THIS intern's start_date
-                if current_date < intern.start_date:
-                    # This date is before intern started - skip
-                    continue
-                
-                month_diff = (current_date.year - intern.start_date.year) * 12 + (current_date.month - intern.start_date.month)
+            # Collect this intern's edits first, then apply them in one batch
+            removed = []
+            updates = {}
+            column = edited_df[intern.name].to_numpy(dtype=object)
+            is_empty = pd.isna(column)
+            
+            # Calculate month_idx relative to THIS intern's start_date
+            month_diffs = row_months - np.datetime64(intern.start_date, 'M').astype(np.int64)
+            
+            # Rows before the intern started (or with no date) are skipped
+            rows = np.flatnonzero(row_dates >= np.datetime64(intern.start_date))
+            if changed is not None:
+                rows = rows[changed[rows, edited_df.columns.get_loc(intern.name)]]
+            
+            for row in rows:
+                current_date = dates[row]
+                station_name = column[row]
+                month_diff = int(month_diffs[row])
                 
                 # Skip empty cells
-                if pd.isna(station_name) or not str(station_name).strip():
+                if is_empty[row] or not str(station_name).strip():
                     # Remove assignment if it exists
                     if month_diff in intern.assignments:
-                        del intern.assignments[month_diff]
-                        changes_made = True
+                        removed.append(month_diff)
                     continue
                 
                 # Normalize station name
                 station_name_normalized = str(station_name).strip().lower()
                 
                 # Find matching station key
-                station_key = None
-                
-                # First try direct mapping
-                if station_name_normalized in station_mapping:
-                    station_key = station_mapping[station_name_normalized]
-                else:
-                    # Try partial match
-                    for key, station in stations_config.items():
-                        if station_name_normalized in station.name.lower() or station.name.lower() in station_name_normalized:
-                            station_key = key
-                            break
+                station_key = _resolve_station_key(model, station_name_normalized)
                 
                 if station_key:
                     # Check if this is a change
-                    if month_diff not in intern.assignments or intern.assignments[month_diff] != station_key:
-                        intern.assignments[month_diff] = station_key
-                        changes_made = True
+                    if intern.assignments.get(month_diff) != station_key:
+                        updates[month_diff] = station_key
                 else:
                     errors.append(f"{intern.name}, {current_date.strftime('%Y-%m')}: Unknown station '{station_name}'")
             
-            if changes_made:
+            if removed or updates:
+                for month_diff in removed:
+                    del intern.assignments[month_diff]
+                intern.assignments.update(updates)
+                
                 # Recalculate leave counts after changes
                 intern.calculate_leave_counts()
                 updated_count += 1
@@ -415,8 +641,10 @@ def sync_editor_changes(edited_df):
         return True, f"✓ Successfully updated {updated_count} intern schedules", updated_count
     
     except Exception as e:
-        import traceback
-        return False, f"Error syncing changes: {str(e)}\n{traceback.format_exc()}", 0
+        message = str(e)
+        if st.session_state.get('debug_mode', False):
+            message += f"\n{traceback.format_exc()}"
+        return False, f"Error syncing changes: {message}", 0
 
 def send_email(intern):
     """Mock email sending function for demo."""
@@ -450,13 +678,12 @@ def tool_get_intern_schedule(interns, intern_name):
             "Schedule (month index -> station):"
         ]
         
-        # Sort assignments by month index
+        # Sort assignments by month index; all month labels in one vectorized pass
         sorted_assignments = sorted(intern.assignments.items())
-        for month_idx, station in sorted_assignments:
-            # Calculate actual date for this month
-            actual_date = intern.start_date + timedelta(days=month_idx * 30)
-            month_str = actual_date.strftime('%b %Y')
-            schedule_lines.append(f"  Month {month_idx} ({month_str}): {station}")
+        month_idxs = np.array([month_idx for month_idx, _ in sorted_assignments], dtype=np.int64)
+        month_strs = (pd.Timestamp(intern.start_date) + pd.to_timedelta(30 * month_idxs, unit='D')).strftime('%b %Y')
+        schedule_lines.extend(f"  Month {month_idx} ({month_str}): {station}"
+                              for (month_idx, station), month_str in zip(sorted_assignments, month_strs))
         
         results.append("\n".join(schedule_lines))
     
@@ -469,21 +696,23 @@ def tool_get_station_assignments(interns, station_name, month_year=None):
         return "No interns loaded in the system."
     
     station_name_lower = station_name.lower()
+    month_year_lower = month_year.lower() if month_year else None
     results = []
     
+    # Match each distinct station once (case-insensitive partial match)
+    all_stations = {station for intern in interns for station in intern.assignments.values()}
+    matching_stations = {station for station in all_stations if station_name_lower in station.lower()}
+    
     for intern in interns:
         for month_idx, station in intern.assignments.items():
-            # Check if station matches (case-insensitive partial match)
-            if station_name_lower in station.lower():
+            if station in matching_stations:
                 # Calculate actual date
                 actual_date = intern.start_date + timedelta(days=month_idx * 30)
                 month_str = actual_date.strftime('%B %Y')
                 
                 # Filter by month_year if provided
-                if month_year:
-                    month_year_lower = month_year.lower()
-                    if month_year_lower not in month_str.lower():
-                        continue
+                if month_year_lower and month_year_lower not in month_str.lower():
+                    continue
                 
                 results.append({
                     'intern': intern.name,
@@ -512,6 +741,64 @@ def tool_get_station_assignments(interns, station_name, month_year=None):
     return "\n".join(output_lines)
 
 
+# Function declarations offered to Gemini for tool calling
+_GEMINI_TOOLS = [
+    {
+        "function_declarations": [
+            {
+                "name": "get_intern_schedule",
+                "description": "Get the full schedule for a specific intern including their model, department, start date, and all monthly assignments. Use this when the user asks about a specific intern's schedule.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "intern_name": {
+                            "type": "string",
+                            "description": "The name (or partial name) of the intern to look up"
+                        }
+                    },
+                    "required": ["intern_name"]
+                }
+            },
+            {
+                "name": "get_station_assignments",
+                "description": "Get all interns assigned to a specific station, optionally filtered by month. Use this when the user asks who is working at a station or about station staffing.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "station_name": {
+                            "type": "string",
+                            "description": "The name of the station (e.g., 'Birth', 'HRP A', 'Gynecology B', 'IVF')"
+                        },
+                        "month_year": {
+                            "type": "string",
+                            "description": "Optional: specific month to filter by (e.g., 'July 2025', 'January 2026')"
+                        }
+                    },
+                    "required": ["station_name"]
+                }
+            }
+        ]
+    }
+]
+
+
+# Tool name -> handler(interns, args) for Gemini function calls
+_TOOL_HANDLERS = {
+    "get_intern_schedule": lambda interns, args: tool_get_intern_schedule(
+        interns, args.get("intern_name", "")),
+    "get_station_assignments": lambda interns, args: tool_get_station_assignments(
+        interns, args.get("station_name", ""), args.get("month_year")),
+}
+
+
+@st.cache_resource(show_spinner=False)
+def _gemini_model(api_key):
+    """Configure the Gemini SDK and build the tool-enabled model once per API key."""
+    import google.generativeai as genai
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel('gemini-2.5-flash', tools=_GEMINI_TOOLS)
+
+
 def get_ai_response(user_input, context, message_history=None, interns=None):
     """Get AI response from Gemini API with function calling tools."""
     # Extract context information
@@ -564,50 +851,11 @@ INSTRUCTIONS:
         if not api_key:
             return "⚠️ GOOGLE_API_KEY not found. Please set up your API key in the .env file."
         
-        genai.configure(api_key=api_key)
+        # Imported here so app start-up does not pay for the Gemini SDK
+        import google.generativeai as genai
         
-        # Define the tools for function calling
-        tools = [
-            {
-                "function_declarations": [
-                    {
-                        "name": "get_intern_schedule",
-                        "description": "Get the full schedule for a specific intern including their model, department, start date, and all monthly assignments. Use this when the user asks about a specific intern's schedule.",
-                        "parameters": {
-                            "type": "object",
-                            "properties": {
-                                "intern_name": {
-                                    "type": "string",
-                                    "description": "The name (or partial name) of the intern to look up"
-                                }
-                            },
-                            "required": ["intern_name"]
-                        }
-                    },
-                    {
-                        "name": "get_station_assignments",
-                        "description": "Get all interns assigned to a specific station, optionally filtered by month. Use this when the user asks who is working at a station or about station staffing.",
-                        "parameters": {
-                            "type": "object",
-                            "properties": {
-                                "station_name": {
-                                    "type": "string",
-                                    "description": "The name of the station (e.g., 'Birth', 'HRP A', 'Gynecology B', 'IVF')"
-                                },
-                                "month_year": {
-                                    "type": "string",
-                                    "description": "Optional: specific month to filter by (e.g., 'July 2025', 'January 2026')"
-                                }
-                            },
-                            "required": ["station_name"]
-                        }
-                    }
-                ]
-            }
-        ]
-        
-        # Create model with tools
-        model = genai.GenerativeModel('gemini-2.5-flash', tools=tools)
+        # Configured model with tools, shared across messages
+        model = _gemini_model(api_key)
         
         # Build conversation history for the chat
         chat_history = []
@@ -645,16 +893,8 @@ INSTRUCTIONS:
             func_name = function_call.name
             func_args = dict(function_call.args)
             
-            if func_name == "get_intern_schedule":
-                result = tool_get_intern_schedule(interns, func_args.get("intern_name", ""))
-            elif func_name == "get_station_assignments":
-                result = tool_get_station_assignments(
-                    interns, 
-                    func_args.get("station_name", ""),
-                    func_args.get("month_year")
-                )
-            else:
-                result = f"Unknown function: {func_name}"
+            handler = _TOOL_HANDLERS.get(func_name)
+            result = handler(interns, func_args) if handler else f"Unknown function: {func_name}"
             
             # Send the function result back to the model
             response = chat.send_message(
@@ -697,6 +937,79 @@ else:
     </div>
     """, unsafe_allow_html=True)
 
+@st.fragment
+def copilot_chat():
+    """Sidebar chat; prompts rerun only this fragment, not the tabs."""
+    st.divider()
+    col_header1, col_header2 = st.columns([3, 1])
+    with col_header1:
+        st.header("🤖 ResiPlan Copilot")
+    with col_header2:
+        if st.button("🗑️", help="Clear chat", key="clear_chat"):
+            st.session_state.messages = []
+    
+    st.caption("Ask me anything about your schedule!")
+    
+    # Chat history box; filled after the prompt is handled so a new
+    # exchange shows up without another rerun
+    chat_container = st.container(height=300)
+    
+    # Chat input
+    if prompt := st.chat_input("Ask about bottlenecks, constraints, or optimization..."):
+        # Add user message to history
+        st.session_state.messages.append({"role": "user", "content": prompt})
+        
+        # Build context for AI
+        context = {
+            'total_interns': len(st.session_state.interns),
+            'bottleneck_count': 0,
+            'critical_stations': [],
+            'intern_names': [i.name for i in st.session_state.interns] if st.session_state.interns else [],
+            'station_names': list(config.STATIONS_MODEL_A.keys())
+        }
+        
+        # Get bottleneck info if available
+        if st.session_state.interns:
+            try:
+                analysis = _bottleneck_analysis(_interns_fingerprint(st.session_state.interns),
+                                                st.session_state.interns, lookahead_months=12)
+                context['bottleneck_count'] = analysis['bottlenecks_found']
+                
+                # Extract critical stations, deduplicated in order of first appearance
+                context['critical_stations'] = list(dict.fromkeys(
+                    issue.get('station', 'Unknown')
+                    for bottleneck in analysis.get('bottlenecks', [])
+                    for issue in bottleneck.get('issues', [])
+                    if issue.get('severity') == 'critical'
+                ))
+            except:
+                pass
+        
+        # Get AI response with conversation history and interns data
+        response = get_ai_response(prompt, context, st.session_state.messages, st.session_state.interns)
+        
+        # Add assistant response to history
+        st.session_state.messages.append({"role": "assistant", "content": response})
+    
+    # Display chat history
+    with chat_container:
+        # Show welcome message if no messages
+        if not st.session_state.messages:
+            with st.chat_message("assistant"):
+                st.write("""👋 Hi! I'm your AI scheduling assistant.
+
+I can help you:
+- Analyze bottlenecks
+- Explain constraints
+- Suggest optimizations
+- Troubleshoot issues
+
+Try asking: *"What bottlenecks do I have?"* or *"How can I optimize my schedule?"*""")
+        
+        for message in st.session_state.messages:
+            with st.chat_message(message["role"]):
+                st.write(message["content"])
+
 # ==================== SIDEBAR ====================
 with st.sidebar:
     # Sidebar logo
@@ -731,6 +1044,25 @@ with st.sidebar:
         help="Maximum time for AI scheduler to run"
     )
     
+    # Parallel CP-SAT search workers
+    max_workers = os.cpu_count() or 1
+    if max_workers > 1:
+        num_workers = st.slider(
+            "🧠 CPU Workers",
+            min_value=1,
+            max_value=max_workers,
+            value=min(16, max_workers),
+            help="Parallel search workers used by the AI scheduler"
+        )
+    else:
+        num_workers = 1
+    
+    st.checkbox(
+        "🐞 Debug mode",
+        key="debug_mode",
+        help="Include full tracebacks in editor sync errors"
+    )
+    
     st.divider()
     
     # Load data button
@@ -744,6 +1076,7 @@ with st.sidebar:
                     st.error(f"Error: {error}")
                 else:
                     st.session_state.interns = interns
+                    st.session_state.start_month = min(intern.start_date for intern in interns)
                     st.session_state.current_date = current_date
                     st.session_state.schedule_generated = False
                     st.success(f"✅ Loaded {len(interns)} interns!")
@@ -751,22 +1084,32 @@ with st.sidebar:
     # Run scheduler button
     if st.session_state.interns:
         st.divider()
-        if st.button("🚀 Run AI Scheduler", type="primary", use_container_width=True):
-            with st.spinner("Running AI scheduler... This may take a few minutes."):
-                solution, error = run_scheduler(
-                    st.session_state.interns,
+        if st.session_state.solve_future is None:
+            if st.button("🚀 Run AI Scheduler", type="primary", use_container_width=True):
+                # Solve a copy in the background so the UI stays responsive
+                st.session_state.solve_fingerprint = _interns_fingerprint(st.session_state.interns)
+                st.session_state.solve_future = _scheduler_executor().submit(
+                    run_scheduler,
+                    copy.deepcopy(st.session_state.interns),
                     st.session_state.current_date,
-                    time_limit
+                    program_start_month(),
+                    time_limit,
+                    num_workers
                 )
-                
-                if error:
-                    st.error(f"Scheduler error: {error}")
-                elif solution and solution.is_feasible:
-                    st.session_state.schedule_generated = True
-                    st.success(f"✅ Schedule generated! ({solution.solve_time:.1f}s)")
-                    st.balloons()
-                else:
-                    st.error("❌ Could not find valid solution")
+                st.rerun()
+        else:
+            scheduler_progress()
+        
+        if st.session_state.scheduler_status:
+            kind, text = st.session_state.scheduler_status
+            st.session_state.scheduler_status = None
+            if kind == 'success':
+                st.success(text)
+                st.balloons()
+            elif kind == 'warning':
+                st.warning(text)
+            else:
+                st.error(text)
     
     # Stats
     if st.session_state.interns:
@@ -782,8 +1125,10 @@ with st.sidebar:
         
         # Quick validation status
         try:
-            validator = ScheduleValidator(st.session_state.interns, use_ai=False, program_config=st.session_state.program_config)
-            quick_val = validator.validate(current_date=st.session_state.current_date)
+            quick_val = _schedule_validation(_interns_fingerprint(st.session_state.interns),
+                                             st.session_state.current_date,
+                                             _config_signature(st.session_state.program_config),
+                                             st.session_state.interns, st.session_state.program_config)
             
             st.divider()
             st.caption("📋 Validation Status")
@@ -799,77 +1144,7 @@ with st.sidebar:
             pass
     
     # AI Advisory Chat
-    st.divider()
-    col_header1, col_header2 = st.columns([3, 1])
-    with col_header1:
-        st.header("🤖 ResiPlan Copilot")
-    with col_header2:
-        if st.button("🗑️", help="Clear chat", key="clear_chat"):
-            st.session_state.messages = []
-            st.rerun()
-    
-    st.caption("Ask me anything about your schedule!")
-    
-    # Display chat history
-    chat_container = st.container(height=300)
-    with chat_container:
-        # Show welcome message if no messages
-        if not st.session_state.messages:
-            with st.chat_message("assistant"):
-                st.write("""👋 Hi! I'm your AI scheduling assistant.
-
-I can help you:
-- Analyze bottlenecks
-- Explain constraints
-- Suggest optimizations
-- Troubleshoot issues
-
-Try asking: *"What bottlenecks do I have?"* or *"How can I optimize my schedule?"*""")
-        
-        for message in st.session_state.messages:
-            with st.chat_message(message["role"]):
-                st.write(message["content"])
-    
-    # Chat input
-    if prompt := st.chat_input("Ask about bottlenecks, constraints, or optimization..."):
-        # Add user message to history
-        st.session_state.messages.append({"role": "user", "content": prompt})
-        
-        # Build context for AI
-        context = {
-            'total_interns': len(st.session_state.interns),
-            'bottleneck_count': 0,
-            'critical_stations': [],
-            'intern_names': [i.name for i in st.session_state.interns] if st.session_state.interns else [],
-            'station_names': list(config.STATIONS_MODEL_A.keys())
-        }
-        
-        # Get bottleneck info if available
-        if st.session_state.interns:
-            try:
-                analyzer = BottleneckAnalyzer(st.session_state.interns, lookahead_months=12)
-                analysis = analyzer.analyze()
-                context['bottleneck_count'] = analysis['bottlenecks_found']
-                
-                # Extract critical stations
-                for bottleneck in analysis.get('bottlenecks', []):
-                    for issue in bottleneck.get('issues', []):
-                        if issue.get('severity') == 'critical':
-                            context['critical_stations'].append(issue.get('station', 'Unknown'))
-                
-                # Remove duplicates
-                context['critical_stations'] = list(set(context['critical_stations']))
-            except:
-                pass
-        
-        # Get AI response with conversation history and interns data
-        response = get_ai_response(prompt, context, st.session_state.messages, st.session_state.interns)
-        
-        # Add assistant response to history
-        st.session_state.messages.append({"role": "assistant", "content": response})
-        
-        # Rerun to display new messages
-        st.rerun()
+    copilot_chat()
 
 # ==================== MAIN CONTENT ====================
 
@@ -881,30 +1156,68 @@ if not st.session_state.interns:
 tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(["📅 God View (Timeline)", "📝 Interactive Editor", "📊 Analytics & Bottlenecks", "👥 Manage Interns", "👤 Personal View", "⚙️ Rules Engine"])
 
 # ==================== TAB 1: GOD VIEW ====================
-with tab1:
+@st.fragment
+def god_view():
+    """God View tab body; changing the resident filter reruns only this fragment."""
     st.subheader("Visual Timeline - 72-Month Overview")
     
-    if st.session_state.interns:
-        with st.spinner("Generating Gantt chart..."):
-            fig = create_gantt_chart(st.session_state.interns)
-            st.plotly_chart(fig, use_container_width=True)
+    if st.session_state.interns and not any(intern.assignments for intern in st.session_state.interns):
+        # Nothing to plot yet - skip fingerprinting and figure building
+        st.info("📅 No assignments yet. Run the AI Scheduler to see the timeline.")
+    elif st.session_state.interns:
+        # Large cohorts render only a window of residents (newest first) by default
+        newest_first = sorted(st.session_state.interns, key=lambda x: x.start_date, reverse=True)
+        all_names = [intern.name for intern in newest_first]
+        visible_names = set(st.multiselect(
+            "Show residents",
+            all_names,
+            default=all_names[:20],
+            help="Limit the timeline to selected residents; capacity usage always covers everyone"
+        ))
+        visible_interns = [intern for intern in st.session_state.interns if intern.name in visible_names]
+        
+        if visible_interns:
+            # Optional year window; blocks outside it are dropped before plotting
+            window = None
+            first_year = min(intern.start_date.year for intern in visible_interns)
+            last_year = max(intern.get_month_date(intern.total_months).year for intern in visible_interns)
+            if last_year > first_year:
+                from_year, to_year = st.select_slider(
+                    "Timeline window",
+                    options=list(range(first_year, last_year + 1)),
+                    value=(first_year, last_year),
+                    help="Only blocks within these years are drawn"
+                )
+                if (from_year, to_year) != (first_year, last_year):
+                    window = (datetime(from_year, 1, 1), datetime(to_year + 1, 1, 1))
+            
+            with st.spinner("Generating Gantt chart..."):
+                fig = _gantt_figure(_interns_fingerprint(visible_interns), window, visible_interns)
+                st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("Select at least one resident to show the timeline.")
         
         st.divider()
         
         st.subheader("Capacity Usage Over Time")
-        fig_capacity = create_capacity_chart(st.session_state.interns)
+        fig_capacity = _capacity_figure(_interns_fingerprint(st.session_state.interns), st.session_state.interns)
         st.plotly_chart(fig_capacity, use_container_width=True)
     else:
         st.warning("No intern data loaded")
 
+with tab1:
+    god_view()
+
 # ==================== TAB 2: INTERACTIVE EDITOR ====================
-with tab2:
+@st.fragment
+def schedule_editor():
+    """Editor tab body; cell edits rerun only this fragment, not the whole app."""
     st.subheader("Manual Schedule Editor")
     st.caption("Edit cells directly to modify assignments. Changes are applied when you click 'Save & Re-validate'.")
     
     if st.session_state.interns:
         # Convert to DataFrame
-        df = interns_to_dataframe(st.session_state.interns)
+        df = _editor_frame(_interns_fingerprint(st.session_state.interns), st.session_state.interns)
         
         if not df.empty:
             # Info box with instructions
@@ -939,163 +1252,143 @@ with tab2:
                                        help="Apply changes and re-run bottleneck analysis")
             
             if save_button:
-                with st.spinner("🔄 Syncing changes to intern schedules..."):
+                # Sync, validate and analyze first, then render all results in one pass
+                validation_result = validation_error = analysis = analysis_error = None
+                with st.spinner("🔄 Syncing, validating and analyzing changes..."):
                     # Sync changes to intern objects
-                    success, message, updated_count = sync_editor_changes(edited_df)
+                    success, message, updated_count = sync_editor_changes(edited_df, df)
                     
                     if success:
-                        st.toast(f"✓ Updated {updated_count} schedules! Validating...", icon="✅")
-                        
-                        # Show sync summary
-                        st.success(message)
+                        interns_fp = _interns_fingerprint(st.session_state.interns)
                         
                         # Run comprehensive validation
-                        with st.spinner("🔍 Running validation checks..."):
-                            try:
-                                validator = ScheduleValidator(st.session_state.interns, use_ai=False, program_config=st.session_state.program_config)
-                                validation_result = validator.validate(current_date=st.session_state.current_date)
-                                
-                                # Display validation results
-                                st.divider()
-                                st.markdown("### 🔍 Validation Results")
-                                
-                                col_val1, col_val2, col_val3 = st.columns(3)
-                                with col_val1:
-                                    st.metric("Errors", len(validation_result.errors),
-                                             delta=f"-{len(validation_result.errors)}" if len(validation_result.errors) > 0 else None,
-                                             delta_color="inverse")
-                                with col_val2:
-                                    st.metric("Warnings", len(validation_result.warnings),
-                                             delta=f"-{len(validation_result.warnings)}" if len(validation_result.warnings) > 0 else None,
-                                             delta_color="inverse")
-                                with col_val3:
-                                    status_icon = "✅" if validation_result.is_valid else "❌"
-                                    st.metric("Status", f"{status_icon} {'Valid' if validation_result.is_valid else 'Invalid'}")
-                                
-                                # Show errors
-                                if validation_result.errors:
-                                    st.error("🔴 **Validation Errors** (Must be fixed)")
-                                    error_data = []
-                                    for error in validation_result.errors:
-                                        # Parse error message
-                                        if ':' in error:
-                                            parts = error.split(':', 1)
-                                            intern_name = parts[0].strip()
-                                            description = parts[1].strip() if len(parts) > 1 else error
-                                        else:
-                                            intern_name = "General"
-                                            description = error
-                                        
-                                        error_data.append({
-                                            "Intern": intern_name,
-                                            "Type": "Error",
-                                            "Description": description
-                                        })
-                                    
-                                    df_errors = pd.DataFrame(error_data)
-                                    st.dataframe(df_errors, use_container_width=True, height=min(300, len(error_data) * 35 + 38))
-                                
-                                # Show warnings
-                                if validation_result.warnings:
-                                    st.warning("🟡 **Validation Warnings** (Recommended to fix)")
-                                    warning_data = []
-                                    for warning in validation_result.warnings:
-                                        if ':' in warning:
-                                            parts = warning.split(':', 1)
-                                            intern_name = parts[0].strip()
-                                            description = parts[1].strip() if len(parts) > 1 else warning
-                                        else:
-                                            intern_name = "General"
-                                            description = warning
-                                        
-                                        warning_data.append({
-                                            "Intern": intern_name,
-                                            "Type": "Warning",
-                                            "Description": description
-                                        })
-                                    
-                                    df_warnings = pd.DataFrame(warning_data)
-                                    st.dataframe(df_warnings, use_container_width=True, height=min(200, len(warning_data) * 35 + 38))
-                                
-                                # Show success if valid
-                                if validation_result.is_valid:
-                                    st.success("✅ **All validation checks passed!** Schedule is compliant with all rules.")
-                                    st.balloons()
-                                else:
-                                    st.info("💡 **Note:** Changes are saved even with validation errors. You can override if needed.")
-                                
-                                # Toast notification
-                                if validation_result.is_valid:
-                                    st.toast("✅ Schedule validated - no issues!", icon="✅")
-                                else:
-                                    st.toast(f"⚠️ {len(validation_result.errors)} errors, {len(validation_result.warnings)} warnings", icon="⚠️")
-                                
-                            except Exception as e:
-                                st.error(f"Validation error: {str(e)}")
-                                st.toast("⚠️ Saved but validation failed", icon="⚠️")
+                        try:
+                            validation_result = _schedule_validation(interns_fp, st.session_state.current_date,
+                                                                     _config_signature(st.session_state.program_config),
+                                                                     st.session_state.interns, st.session_state.program_config)
+                        except Exception as e:
+                            validation_error = e
                         
                         # Re-run bottleneck analysis
-                        with st.spinner("📊 Running capacity analysis..."):
-                            try:
-                                analyzer = BottleneckAnalyzer(st.session_state.interns, lookahead_months=12)
-                                analysis = analyzer.analyze()
-                                st.session_state.bottleneck_summary = analysis
-                                
-                                st.divider()
-                                st.markdown("### 📊 Capacity Analysis")
-                                
-                                col_v1, col_v2, col_v3 = st.columns(3)
-                                with col_v1:
-                                    st.metric("Bottlenecks", analysis['bottlenecks_found'])
-                                with col_v2:
-                                    st.metric("Critical", analysis['critical_count'], 
-                                             delta=f"-{analysis['critical_count']}" if analysis['critical_count'] > 0 else None,
-                                             delta_color="inverse")
-                                with col_v3:
-                                    st.metric("Capacity Warnings", analysis['warning_count'],
-                                             delta=f"-{analysis['warning_count']}" if analysis['warning_count'] > 0 else None,
-                                             delta_color="inverse")
-                                
-                            except Exception as e:
-                                st.warning(f"Capacity analysis error: {str(e)}")
-                        
-                        # Save edited state
-                        st.session_state.edited_df = edited_df.copy()
-                        
-                        # Keep validation results displayed
-                        st.info("💡 Changes saved! Switch to Tab 1 (God View) or Tab 3 (Analytics) to see updated visualizations.")
+                        try:
+                            analysis = _bottleneck_analysis(interns_fp, st.session_state.interns, lookahead_months=12)
+                            st.session_state.bottleneck_summary = analysis
+                        except Exception as e:
+                            analysis_error = e
+                
+                if success:
+                    st.session_state.saved_editor_signature = _frame_signature(edited_df)
+                    
+                    # Full rerun so the sidebar, God View and Analytics pick up the
+                    # edit; the results are rendered on that run
+                    st.session_state.save_report = (message, updated_count, validation_result, validation_error,
+                                                    analysis, analysis_error)
+                    st.rerun(scope="app")
+                else:
+                    st.error(message)
+                    st.toast("❌ Sync failed - check error details above", icon="❌")
+            
+            if st.session_state.save_report is not None:
+                (message, updated_count, validation_result, validation_error,
+                 analysis, analysis_error) = st.session_state.save_report
+                st.session_state.save_report = None
+                
+                # Show sync summary
+                st.success(message)
+                
+                if validation_result is not None:
+                    # Display validation results
+                    st.divider()
+                    st.markdown("### 🔍 Validation Results")
+                    
+                    col_val1, col_val2, col_val3 = st.columns(3)
+                    with col_val1:
+                        st.metric("Errors", len(validation_result.errors),
+                                 delta=_neg_delta(len(validation_result.errors)),
+                                 delta_color="inverse")
+                    with col_val2:
+                        st.metric("Warnings", len(validation_result.warnings),
+                                 delta=_neg_delta(len(validation_result.warnings)),
+                                 delta_color="inverse")
+                    with col_val3:
+                        status_icon = "✅" if validation_result.is_valid else "❌"
+                        st.metric("Status", f"{status_icon} {'Valid' if validation_result.is_valid else 'Invalid'}")
+                    
+                    # Show errors
+                    if validation_result.errors:
+                        st.error("🔴 **Validation Errors** (Must be fixed)")
+                        df_errors = _messages_frame(validation_result.errors, "Error")
+                        _capped_dataframe(df_errors, height=min(300, len(df_errors) * 35 + 38))
+                    
+                    # Show warnings
+                    if validation_result.warnings:
+                        st.warning("🟡 **Validation Warnings** (Recommended to fix)")
+                        df_warnings = _messages_frame(validation_result.warnings, "Warning")
+                        _capped_dataframe(df_warnings, height=min(200, len(df_warnings) * 35 + 38))
+                    
+                    # Show success if valid
+                    if validation_result.is_valid:
+                        st.success("✅ **All validation checks passed!** Schedule is compliant with all rules.")
+                        st.balloons()
+                        st.toast(f"✅ Updated {updated_count} schedules - no issues!", icon="✅")
                     else:
-                        st.error(message)
-                        st.toast("❌ Sync failed - check error details above", icon="❌")
+                        st.info("💡 **Note:** Changes are saved even with validation errors. You can override if needed.")
+                        st.toast(f"⚠️ Updated {updated_count} schedules: {len(validation_result.errors)} errors, "
+                                 f"{len(validation_result.warnings)} warnings", icon="⚠️")
+                else:
+                    st.error(f"Validation error: {str(validation_error)}")
+                    st.toast("⚠️ Saved but validation failed", icon="⚠️")
+                
+                if analysis is not None:
+                    st.divider()
+                    st.markdown("### 📊 Capacity Analysis")
+                    
+                    col_v1, col_v2, col_v3 = st.columns(3)
+                    with col_v1:
+                        st.metric("Bottlenecks", analysis['bottlenecks_found'])
+                    with col_v2:
+                        st.metric("Critical", analysis['critical_count'], 
+                                 delta=_neg_delta(analysis['critical_count']),
+                                 delta_color="inverse")
+                    with col_v3:
+                        st.metric("Capacity Warnings", analysis['warning_count'],
+                                 delta=_neg_delta(analysis['warning_count']),
+                                 delta_color="inverse")
+                else:
+                    st.warning(f"Capacity analysis error: {str(analysis_error)}")
+                
+                st.info("💡 Changes saved! Tab 1 (God View) and Tab 3 (Analytics) now show the updated schedule.")
             
             # Show last sync info and change detection
-            if st.session_state.edited_df is not None:
+            if st.session_state.saved_editor_signature is not None:
                 st.divider()
                 col_info1, col_info2 = st.columns([3, 1])
                 with col_info1:
                     st.caption("💡 **Tip:** After saving, check Tab 1 (God View) and Tab 3 (Analytics) for updated visualizations.")
                 with col_info2:
-                    # Check if dataframe has unsaved changes
-                    try:
-                        if not edited_df.equals(st.session_state.edited_df):
-                            st.warning("⚠️ Unsaved changes")
-                        else:
-                            st.success("✓ All saved")
-                    except:
-                        pass
+                    # Check if dataframe has unsaved changes against the signature
+                    # taken at the last save
+                    if _frame_signature(edited_df) != st.session_state.saved_editor_signature:
+                        st.warning("⚠️ Unsaved changes")
+                    else:
+                        st.success("✓ All saved")
         else:
             st.warning("No schedule data to display")
     else:
         st.warning("No intern data loaded")
 
+with tab2:
+    schedule_editor()
+
 # ==================== TAB 3: ANALYTICS ====================
 with tab3:
     st.subheader("Future Bottleneck Analysis")
     
     if st.session_state.interns:
         try:
-            analyzer = BottleneckAnalyzer(st.session_state.interns, lookahead_months=12)
-            analysis = analyzer.analyze()
+            interns_fp = _interns_fingerprint(st.session_state.interns)
+            analysis = _bottleneck_analysis(interns_fp, st.session_state.interns, lookahead_months=12)
+            issues = _bottleneck_issues(interns_fp, analysis)
             
             # Store in session state for AI chat
             st.session_state.bottleneck_summary = analysis
@@ -1114,7 +1407,7 @@ with tab3:
                 st.metric(
                     "Bottlenecks Found",
                     analysis['bottlenecks_found'],
-                    delta=f"-{analysis['bottlenecks_found']}" if analysis['bottlenecks_found'] > 0 else None,
+                    delta=_neg_delta(analysis['bottlenecks_found']),
                     delta_color="inverse"
                 )
             
@@ -1122,7 +1415,7 @@ with tab3:
                 st.metric(
                     "Critical Issues",
                     analysis['critical_count'],
-                    delta=f"-{analysis['critical_count']}" if analysis['critical_count'] > 0 else None,
+                    delta=_neg_delta(analysis['critical_count']),
                     delta_color="inverse"
                 )
             
@@ -1130,7 +1423,7 @@ with tab3:
                 st.metric(
                     "Warnings",
                     analysis['warning_count'],
-                    delta=f"-{analysis['warning_count']}" if analysis['warning_count'] > 0 else None,
+                    delta=_neg_delta(analysis['warning_count']),
                     delta_color="inverse"
                 )
             
@@ -1140,15 +1433,19 @@ with tab3:
             if analysis['critical_count'] > 0:
                 st.error("🔴 Critical Issues Detected")
                 
-                for bottleneck in analysis['bottlenecks']:
-                    critical_issues = [i for i in bottleneck['issues'] if i['severity'] == 'critical']
-                    if critical_issues:
-                        month = bottleneck['month']
-                        st.warning(f"**Month {month + 1}:**")
-                        for issue in critical_issues:
-                            st.write(f"- {issue['station']}: {issue['type']}")
-                            if 'deficit' in issue:
-                                st.write(f"  → Needs **{issue['deficit']}** more interns")
+                critical = issues[issues['Severity'] == 'critical']
+                for month, critical_issues in critical.groupby('Month', sort=False):
+                    st.warning(f"**Month {month}:**")
+                    
+                    # One markdown block per month rather than one element per line
+                    lines = []
+                    for station, issue_type, deficit in zip(critical_issues['Station'], critical_issues['Type'],
+                                                            critical_issues['Deficit']):
+                        line = f"- {station}: {issue_type}"
+                        if deficit != 'N/A':
+                            line += f" → Needs **{deficit}** more interns"
+                        lines.append(line)
+                    st.markdown("\n".join(lines))
             
             st.divider()
             
@@ -1163,20 +1460,9 @@ with tab3:
                 st.divider()
                 st.subheader("Detailed Bottleneck Report")
                 
-                bottleneck_data = []
-                for bottleneck in analysis['bottlenecks']:
-                    for issue in bottleneck['issues']:
-                        bottleneck_data.append({
-                            'Month': bottleneck['month'] + 1,
-                            'Station': issue['station'],
-                            'Type': issue['type'],
-                            'Severity': issue['severity'],
-                            'Details': f"Deficit: {issue.get('deficit', 'N/A')}, Excess: {issue.get('excess', 'N/A')}"
-                        })
-                
-                if bottleneck_data:
-                    df_bottlenecks = pd.DataFrame(bottleneck_data)
-                    st.dataframe(df_bottlenecks, use_container_width=True, height=400)
+                df_bottlenecks = issues[['Month', 'Station', 'Type', 'Severity', 'Details']]
+                if not df_bottlenecks.empty:
+                    _capped_dataframe(df_bottlenecks, height=400)
         
         except Exception as e:
             st.error(f"Error running bottleneck analysis: {str(e)}")
@@ -1227,6 +1513,9 @@ with tab4:
                         
                         # Add to session state
                         st.session_state.interns.append(new_intern)
+                        if st.session_state.start_month is not None:
+                            # Adding can only move the program start earlier
+                            st.session_state.start_month = min(st.session_state.start_month, new_intern.start_date)
                         
                         st.success(f"✅ Added {new_name} successfully!")
                         st.toast(f"✅ {new_name} added to program", icon="✅")
@@ -1236,13 +1525,12 @@ with tab4:
                             with st.spinner(f"Generating schedule for {new_name}..."):
                                 try:
                                     current_date = st.session_state.current_date
-                                    start_month = min(intern.start_date for intern in st.session_state.interns)
-                                    
                                     scheduler = SchedulerWithRelaxation(
                                         interns=st.session_state.interns,
                                         current_date=current_date,
-                                        start_month=start_month,
-                                        time_limit_seconds=120
+                                        start_month=program_start_month(),
+                                        time_limit_seconds=120,
+                                        num_workers=num_workers
                                     )
                                     
                                     solution = scheduler.solve_with_relaxation()
@@ -1265,21 +1553,20 @@ with tab4:
         st.markdown("### 📋 Current Interns")
         
         if st.session_state.interns:
-            # Create DataFrame for display
-            intern_data = []
-            for intern in st.session_state.interns:
-                # Use intelligent progress calculation
-                progress_data = intern.calculate_progress()
-                intern_data.append({
-                    "Name": intern.name,
-                    "Email": intern.email if intern.email else "—",
-                    "Model": intern.model,
-                    "Dept": intern.department,
-                    "Progress": f"{progress_data['percent']:.1f}%",
-                    "Assigned": f"{int(progress_data['completed'])}/{progress_data['total']}"
-                })
+            # Create DataFrame for display, column by column
+            interns = st.session_state.interns
             
-            df_interns = pd.DataFrame(intern_data)
+            # Use intelligent progress calculation (computed once per intern)
+            progress = [intern.calculate_progress() for intern in interns]
+            
+            df_interns = pd.DataFrame({
+                "Name": [intern.name for intern in interns],
+                "Email": [intern.email if intern.email else "—" for intern in interns],
+                "Model": [intern.model for intern in interns],
+                "Dept": [intern.department for intern in interns],
+                "Progress": [f"{progress_data['percent']:.1f}%" for progress_data in progress],
+                "Assigned": [f"{int(progress_data['completed'])}/{progress_data['total']}" for progress_data in progress]
+            })
             st.dataframe(df_interns, use_container_width=True, height=400)
             
             # Delete intern section
@@ -1295,6 +1582,7 @@ with tab4:
             with col_del2:
                 if st.button("🗑️ Remove", type="secondary", use_container_width=True):
                     st.session_state.interns = [i for i in st.session_state.interns if i.name != intern_to_delete]
+                    st.session_state.start_month = None
                     st.success(f"✅ Removed {intern_to_delete}")
                     st.toast(f"🗑️ {intern_to_delete} removed", icon="🗑️")
                     st.rerun()
@@ -1437,6 +1725,7 @@ with tab5:
                                 # Handle start date change
                                 if start_date_changed:
                                     intern_to_update.start_date = new_start_date
+                                    st.session_state.start_month = None
                                     
                                     # Recalculate current_month_index based on simulation date
                                     current_date = st.session_state.current_date
@@ -1476,24 +1765,15 @@ with tab5:
                 st.markdown("### 📅 Personal Schedule")
                 
                 if selected_intern.assignments:
-                    stations = config.STATIONS_MODEL_A if selected_intern.model == 'A' else config.STATIONS_MODEL_B
+                    month_idxs = np.array(sorted(selected_intern.assignments), dtype=np.int64)
+                    month_dates = pd.Timestamp(selected_intern.start_date) + pd.to_timedelta(30 * month_idxs, unit='D')
                     
-                    schedule_data = []
-                    for month_idx in sorted(selected_intern.assignments.keys()):
-                        station_key = selected_intern.assignments[month_idx]
-                        station = stations.get(station_key)
-                        station_name = station.name if station else station_key
-                        
-                        month_date = selected_intern.start_date + timedelta(days=30 * month_idx)
-                        status = "✓ Completed" if month_idx <= selected_intern.current_month_index else "Upcoming"
-                        
-                        schedule_data.append({
-                            "Month": month_date.strftime("%b %Y"),
-                            "Station": station_name,
-                            "Status": status
-                        })
-                    
-                    df_schedule = pd.DataFrame(schedule_data)
+                    df_schedule = pd.DataFrame({
+                        "Month": month_dates.strftime("%b %Y"),
+                        "Station": [_station_name(selected_intern.model, selected_intern.assignments[month_idx])
+                                    for month_idx in month_idxs.tolist()],
+                        "Status": np.where(month_idxs <= selected_intern.current_month_index, "✓ Completed", "Upcoming")
+                    })
                     st.dataframe(df_schedule, use_container_width=True, height=400)
                 else:
                     st.info("No assignments yet. Run AI Scheduler to generate schedule.")
@@ -1502,19 +1782,16 @@ with tab5:
                 st.markdown("### 📊 Station Breakdown")
                 
                 if selected_intern.assignments:
-                    # Count months per station
-                    station_counts = {}
-                    stations = config.STATIONS_MODEL_A if selected_intern.model == 'A' else config.STATIONS_MODEL_B
-                    
-                    for month_idx, station_key in selected_intern.assignments.items():
-                        station = stations.get(station_key)
-                        station_name = station.name if station else station_key
-                        station_counts[station_name] = station_counts.get(station_name, 0) + 1
+                    # Count months per station, in order of first appearance
+                    station_counts = pd.Series(
+                        [_station_name(selected_intern.model, station_key)
+                         for station_key in selected_intern.assignments.values()]
+                    ).value_counts(sort=False)
                     
                     # Create chart
                     chart_data = pd.DataFrame({
-                        "Station": list(station_counts.keys()),
-                        "Months": list(station_counts.values())
+                        "Station": station_counts.index,
+                        "Months": station_counts.to_numpy()
                     })
                     
                     st.bar_chart(chart_data.set_index("Station"))
@@ -1529,49 +1806,20 @@ with tab5:
             st.markdown("### 🗓️ Personal Timeline")
             
             if selected_intern.assignments:
-                # Create single-intern Gantt
-                df_data = []
-                stations = config.STATIONS_MODEL_A if selected_intern.model == 'A' else config.STATIONS_MODEL_B
+                # Create single-intern Gantt with the same blocks as the main chart
+                month_idxs = np.array(sorted(selected_intern.assignments), dtype=np.int64)
+                station_keys = [selected_intern.assignments[month_idx] for month_idx in month_idxs.tolist()]
+                codes = pd.factorize(pd.Series(station_keys, dtype=object))[0]
+                block_firsts, block_start, block_end = schedule_blocks(np.zeros_like(month_idxs), month_idxs, codes)
                 
-                current_station = None
-                start_month = None
-                
-                for month_idx in sorted(selected_intern.assignments.keys()):
-                    station_key = selected_intern.assignments[month_idx]
-                    
-                    if station_key != current_station:
-                        if current_station is not None:
-                            station_obj = stations.get(current_station)
-                            station_name = station_obj.name if station_obj else current_station
-                            
-                            start_date = selected_intern.start_date + timedelta(days=30 * start_month)
-                            end_date = selected_intern.start_date + timedelta(days=30 * month_idx)
-                            
-                            df_data.append({
-                                'Station': station_name,
-                                'Start': start_date,
-                                'End': end_date
-                            })
-                        
-                        current_station = station_key
-                        start_month = month_idx
-                
-                # Add final block
-                if current_station is not None:
-                    station_obj = stations.get(current_station)
-                    station_name = station_obj.name if station_obj else current_station
-                    
-                    start_date = selected_intern.start_date + timedelta(days=30 * start_month)
-                    end_date = selected_intern.start_date + timedelta(days=30 * (month_idx + 1))
-                    
-                    df_data.append({
-                        'Station': station_name,
-                        'Start': start_date,
-                        'End': end_date
-                    })
+                origin = pd.Timestamp(selected_intern.start_date)
+                df_timeline = pd.DataFrame({
+                    'Station': [_station_name(selected_intern.model, station_keys[i]) for i in block_firsts.tolist()],
+                    'Start': origin + pd.to_timedelta(30 * block_start, unit='D'),
+                    'End': origin + pd.to_timedelta(30 * block_end, unit='D')
+                })
                 
-                if df_data:
-                    df_timeline = pd.DataFrame(df_data)
+                if not df_timeline.empty:
                     fig_personal = px.timeline(df_timeline, x_start="Start", x_end="End", y="Station",
                                               title=f"{selected_intern.name}'s Schedule Timeline")
                     fig_personal.update_yaxes(categoryorder="total ascending")
@@ -1715,8 +1963,10 @@ with tab6:
                     
                     # Re-validate with new rules
                     if st.session_state.interns:
-                        validator = ScheduleValidator(st.session_state.interns, use_ai=False, program_config=st.session_state.program_config)
-                        validation_result = validator.validate(current_date=st.session_state.current_date)
+                        validation_result = _schedule_validation(_interns_fingerprint(st.session_state.interns),
+                                                                 st.session_state.current_date,
+                                                                 _config_signature(st.session_state.program_config),
+                                                                 st.session_state.interns, st.session_state.program_config)
                         
                         st.divider()
                         st.markdown("### 🔍 Re-validation Results")
@@ -5,6 +5,7 @@ Identifies future capacity bottlenecks and staffing issues.
 
 from typing import List, Dict, Tuple
 from datetime import datetime, timedelta
+import numpy as np
 from data_handler import Intern
 import config
 
@@ -17,6 +18,10 @@ class BottleneckAnalyzer:
         self.lookahead_months = lookahead_months
         self.warnings = []
         self.critical_issues = []
+        self._station_keys = list(config.STATIONS_MODEL_A)
+        stations = config.STATIONS_MODEL_A.values()
+        self._min_interns = np.array([station.min_interns for station in stations], dtype=np.int32)
+        self._max_interns = np.array([station.max_interns for station in stations], dtype=np.int32)
     
     def analyze(self) -> Dict:
         """Perform comprehensive bottleneck analysis."""
@@ -32,10 +37,14 @@ class BottleneckAnalyzer:
         end_month = min(max_month + self.lookahead_months, 
                        max(intern.total_months for intern in self.interns))
         
+        # Interns per station for every analyzed month in one pass
+        matrix = self._station_matrix(start_month, end_month)
+        counts = self._count_per_station_month(matrix, len(self._station_keys))
+        
         bottlenecks = []
         
-        for month_idx in range(start_month, end_month):
-            month_issues = self._analyze_month(month_idx)
+        for offset, month_idx in enumerate(range(start_month, end_month)):
+            month_issues = self._analyze_month(matrix[:, offset], counts[:, offset])
             if month_issues:
                 bottlenecks.append({
                     'month': month_idx,
@@ -52,33 +61,50 @@ class BottleneckAnalyzer:
             'recommendations': self._generate_recommendations(bottlenecks)
         }
     
-    def _analyze_month(self, month_idx: int) -> List[Dict]:
-        """Analyze capacity for a specific month."""
-        issues = []
+    def _station_matrix(self, start_month: int, end_month: int) -> np.ndarray:
+        """
+        Encode assignments for months [start_month, end_month) as an
+        (intern x month) matrix of station indices into STATIONS_MODEL_A.
+        -1 marks unassigned months, months past the intern's program and
+        stations that are not tracked.
+        """
+        key_to_idx = {key: idx for idx, key in enumerate(self._station_keys)}
+        matrix = np.full((len(self.interns), max(end_month - start_month, 0)), -1, dtype=np.int32)
         
-        # Count interns per station this month
-        station_counts = {}
-        interns_at_station = {}
+        for row, intern in enumerate(self.interns):
+            codes = intern.assignment_array(key_to_idx, min(end_month, intern.total_months))[start_month:]
+            matrix[row, :len(codes)] = codes
         
-        for intern in self.interns:
-            if month_idx < intern.total_months and month_idx in intern.assignments:
-                station_key = intern.assignments[month_idx]
-                
-                if station_key not in station_counts:
-                    station_counts[station_key] = 0
-                    interns_at_station[station_key] = []
-                
-                station_counts[station_key] += 1
-                interns_at_station[station_key].append(intern.name)
+        return matrix
+    
+    @staticmethod
+    def _count_per_station_month(matrix: np.ndarray, n_stations: int) -> np.ndarray:
+        """Count interns per (station, month) cell of a station matrix."""
+        counts = np.zeros((n_stations, matrix.shape[1]), dtype=np.int32)
+        rows, months = np.nonzero(matrix >= 0)
+        np.add.at(counts, (matrix[rows, months], months), 1)
+        return counts
+    
+    def _analyze_month(self, column: np.ndarray, month_counts: np.ndarray) -> List[Dict]:
+        """Analyze capacity for one month, given its station matrix column and counts."""
+        issues = []
         
-        # Check against capacity limits
         all_stations = config.STATIONS_MODEL_A
         
-        for station_key, count in station_counts.items():
-            if station_key not in all_stations:
-                continue
-            
-            station = all_stations[station_key]
+        # Stations staffed this month, in order of first appearance
+        present = column[column >= 0]
+        _, first_seen = np.unique(present, return_index=True)
+        present = present[np.sort(first_seen)]
+        
+        # Only stations outside their capacity limits need a closer look
+        out_of_range = ((month_counts[present] < self._min_interns[present])
+                        | (month_counts[present] > self._max_interns[present]))
+        
+        # Check against capacity limits
+        for idx in present[out_of_range]:
+            station = all_stations[self._station_keys[idx]]
+            count = int(month_counts[idx])
+            interns_at_station = [self.interns[row].name for row in np.flatnonzero(column == idx)]
             
             # Check min capacity
             if count < station.min_interns:
@@ -89,7 +115,7 @@ class BottleneckAnalyzer:
                     'current': count,
                     'required': station.min_interns,
                     'deficit': station.min_interns - count,
-                    'interns': interns_at_station[station_key]
+                    'interns': interns_at_station
                 })
             
             # Check max capacity
@@ -101,20 +127,20 @@ class BottleneckAnalyzer:
                     'current': count,
                     'maximum': station.max_interns,
                     'excess': count - station.max_interns,
-                    'interns': interns_at_station[station_key]
+                    'interns': interns_at_station
                 })
         
         # Check for stations with zero coverage
-        for station_key, station in all_stations.items():
-            if station.min_interns > 0 and station_key not in station_counts:
-                issues.append({
-                    'type': 'no_coverage',
-                    'severity': 'critical',
-                    'station': station.name,
-                    'current': 0,
-                    'required': station.min_interns,
-                    'deficit': station.min_interns
-                })
+        for idx in np.flatnonzero((self._min_interns > 0) & (month_counts == 0)):
+            station = all_stations[self._station_keys[idx]]
+            issues.append({
+                'type': 'no_coverage',
+                'severity': 'critical',
+                'station': station.name,
+                'current': 0,
+                'required': station.min_interns,
+                'deficit': station.min_interns
+            })
         
         return issues
     
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
+import numpy as np
 import openpyxl
 from openpyxl.styles import PatternFill, Font, Alignment
 import config
@@ -25,6 +26,18 @@ class Intern:
         if self.model == 'B':
             self.total_months = 66
     
+    def assignment_array(self, key_to_idx: Dict[str, int], length: int) -> np.ndarray:
+        """
+        Dense view of assignments for months [0, length): station index per month,
+        -1 where unassigned or the station is not in key_to_idx.
+        Built from the assignments dict on each call, so it never goes stale.
+        """
+        codes = np.full(max(length, 0), -1, dtype=np.int16)
+        for month_idx, station_key in self.assignments.items():
+            if 0 <= month_idx < length:
+                codes[month_idx] = key_to_idx.get(station_key, -1)
+        return codes
+    
     def calculate_leave_counts(self):
         """Calculate leave counts from assignments."""
         self.maternity_leave_months = sum(1 for s in self.assignments.values() if s == 'חל"ד')
@@ -157,13 +170,43 @@ class Intern:
         }
 
 
+def schedule_blocks(rows: np.ndarray, months: np.ndarray,
+                    codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Group assigned months into schedule blocks.
+    rows, months and codes are parallel arrays with one entry per assignment
+    (owner row, month index, station code). A block is a run of one station
+    over a row's assigned months in month order; unassigned gaps do not split
+    it, so a block ends where the row's next block starts and the row's last
+    block ends after its last assigned month.
+    Returns (first, start, end): the input index of each block's first
+    assignment and the block's start/end month. Blocks are ordered by row, then month.
+    """
+    if not len(months):
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, empty
+    
+    order = np.lexsort((months, rows))
+    rows, months, codes = rows[order], months[order], codes[order]
+    
+    firsts = np.flatnonzero(np.r_[True, (rows[1:] != rows[:-1]) | (codes[1:] != codes[:-1])])
+    start = months[firsts]
+    
+    # Last block of each row runs to the end of its last month
+    last_in_row = np.r_[rows[firsts[1:]] != rows[firsts[:-1]], True]
+    row_end = months[np.r_[firsts[1:], len(months)] - 1] + 1
+    end = np.where(last_in_row, row_end, np.r_[start[1:], 0])
+    
+    return order[firsts], start, end
+
+
 class ExcelParser:
     
     def __init__(self):
         """Initialize Excel parser."""
         pass
     
-    def parse_excel(self, file_path: str, current_date: datetime) -> List[Intern]:
+    def parse_excel(self, path_or_buffer: Union[str, BinaryIO], current_date: datetime) -> List[Intern]:
         """
         Parse Excel file with individual intern timelines.
         
@@ -174,8 +217,10 @@ class ExcelParser:
         Cell values: Hebrew station names
         
         CRITICAL: Each intern's start_date is the FIRST row where they have a non-empty cell.
+        
+        path_or_buffer may be a file path or a binary file-like object (e.g. BytesIO).
         """
-        wb = openpyxl.load_workbook(file_path)
+        wb = openpyxl.load_workbook(path_or_buffer)
         ws = wb.active
         
         # Step 1: Read header row to get intern names (DO NOT create Intern objects yet)
@@ -9,10 +9,11 @@ import config
 class ScheduleSolution:
     """Holds the solution from the scheduler."""
     
-    def __init__(self, interns: List[Intern], status: str, solve_time: float):
+    def __init__(self, interns: List[Intern], status: str, solve_time: float, from_cache: bool = False):
         self.interns = interns
         self.status = status
         self.solve_time = solve_time
+        self.from_cache = from_cache  # Replayed from an earlier identical run
         self.is_optimal = status == 'OPTIMAL'
         self.is_feasible = status in ['OPTIMAL', 'FEASIBLE']
 
@@ -21,11 +22,13 @@ class InternshipScheduler:
     """Main scheduler class that uses OR-Tools to generate schedules."""
     
     def __init__(self, interns: List[Intern], current_date: datetime, 
-                 start_month: datetime, time_limit_seconds: int = 300):
+                 start_month: datetime, time_limit_seconds: int = 300,
+                 num_workers: Optional[int] = None):
         self.interns = interns
         self.current_date = current_date
         self.start_month = start_month
         self.time_limit_seconds = time_limit_seconds
+        self.num_workers = num_workers  # None = CP-SAT default
         self.constraint_builder = None
         self.solver = None
         
@@ -70,6 +73,7 @@ class InternshipScheduler:
         self.solver = cp_model.CpSolver()
         self.solver.parameters.max_time_in_seconds = self.time_limit_seconds
         self.solver.parameters.log_search_progress = True
+        self._apply_worker_count()
         
         print(f"\nSolving with time limit of {self.time_limit_seconds} seconds...")
         status = self.solver.Solve(model)
@@ -89,6 +93,11 @@ class InternshipScheduler:
             print("No solution found.")
             return ScheduleSolution(self.interns, status_name, solve_time)
     
+    def _apply_worker_count(self):
+        """Forward the requested number of parallel search workers to CP-SAT."""
+        if self.num_workers is not None:
+            self.solver.parameters.num_search_workers = self.num_workers
+    
     def _extract_solution(self):
         """Extract the solution and update intern assignments."""
         
@@ -163,8 +172,9 @@ class SchedulerWithRelaxation(InternshipScheduler):
     """Extended scheduler that can relax constraints if no solution found."""
     
     def __init__(self, interns: List[Intern], current_date: datetime, 
-                 start_month: datetime, time_limit_seconds: int = 300):
-        super().__init__(interns, current_date, start_month, time_limit_seconds)
+                 start_month: datetime, time_limit_seconds: int = 300,
+                 num_workers: Optional[int] = None):
+        super().__init__(interns, current_date, start_month, time_limit_seconds, num_workers)
         self.relaxation_level = 0
     
     def solve_with_relaxation(self) -> ScheduleSolution:
@@ -222,6 +232,7 @@ class SchedulerWithRelaxation(InternshipScheduler):
         # Solve
         self.solver = cp_model.CpSolver()
         self.solver.parameters.max_time_in_seconds = self.time_limit_seconds
+        self._apply_worker_count()
         
         status = self.solver.Solve(model)
         status_name = self.solver.StatusName(status)
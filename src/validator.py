@@ -3,11 +3,12 @@ from datetime import datetime, timedelta
 from data_handler import Intern
 import config
 import os
+import importlib.util
 from dotenv import load_dotenv
 
+# Only check that the Gemini SDK is installed; it is imported when AI is set up
 try:
-    import google.generativeai as genai
-    GENAI_AVAILABLE = True
+    GENAI_AVAILABLE = importlib.util.find_spec('google.generativeai') is not None
 except ImportError:
     GENAI_AVAILABLE = False
 
@@ -96,6 +97,7 @@ class ScheduleValidator:
         api_key = os.getenv('GOOGLE_API_KEY')
         
         if api_key:
+            import google.generativeai as genai
             genai.configure(api_key=api_key)
             self.ai_client = genai.GenerativeModel('gemini-pro')
         else:
@@ -8,9 +8,11 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from datetime import datetime, timedelta
-from data_handler import Intern, ExcelWriter, ExcelParser
+import numpy as np
+from data_handler import Intern, ExcelWriter, ExcelParser, schedule_blocks
 from scheduler import SchedulerWithRelaxation
 from validator import ScheduleValidator
+from bottleneck_analyzer import BottleneckAnalyzer
 import config
 
 
@@ -226,6 +228,104 @@ def test_excel_io():
     print()
 
 
+def test_schedule_blocks():
+    """Test Gantt block grouping for an intern with an unassigned gap."""
+    
+    print("="*60)
+    print("TESTING SCHEDULE BLOCKS")
+    print("="*60)
+    print()
+    
+    # Intern 0: birth 0-1, gap at 2-3, birth 4, gap at 5, hrp_a 6-7
+    # Intern 1: orientation 0, gap at 1, orientation 2
+    rows = np.array([0, 0, 0, 0, 0, 1, 1])
+    months = np.array([0, 1, 4, 6, 7, 0, 2])
+    station_keys = ['birth', 'birth', 'birth', 'hrp_a', 'hrp_a', 'orientation', 'orientation']
+    codes = np.array([['birth', 'hrp_a', 'orientation'].index(k) for k in station_keys])
+    
+    # Shuffled input must give the same blocks
+    order = np.array([6, 3, 0, 5, 2, 4, 1])
+    firsts, start, end = schedule_blocks(rows[order], months[order], codes[order])
+    blocks = [(int(rows[order][i]), station_keys[order[i]], int(s), int(e))
+              for i, s, e in zip(firsts, start, end)]
+    
+    print(f"✓ Blocks: {blocks}")
+    print()
+    
+    # Gaps are bridged: a block runs until the next block starts
+    assert blocks == [
+        (0, 'birth', 0, 6),
+        (0, 'hrp_a', 6, 8),
+        (1, 'orientation', 0, 3),
+    ]
+
+
+def test_bottleneck_analysis():
+    """Test bottleneck detection on a small single-month roster."""
+    
+    print("="*60)
+    print("TESTING BOTTLENECK ANALYSIS")
+    print("="*60)
+    print()
+    
+    # Month 10: Gynecology A over its max (2), Birth under its min (3), IVF at
+    # its min (2), one unknown station key, and one Birth assignment past the
+    # end of that intern's program (not counted)
+    roster = [
+        ("Intern G1", 'גינקולוגיה א', 72),
+        ("Intern B1", 'חדר לידה', 72),
+        ("Intern G2", 'גינקולוגיה א', 72),
+        ("Intern G3", 'גינקולוגיה א', 72),
+        ("Intern U1", 'unknown-station', 72),
+        ("Intern I1", 'IVF', 72),
+        ("Intern I2", 'IVF', 72),
+        ("Intern X1", 'חדר לידה', 10),
+    ]
+    interns = []
+    for name, station_key, total_months in roster:
+        intern = Intern(
+            name=name,
+            start_date=datetime(2024, 1, 1),
+            model='A',
+            department='A',
+            current_month_index=9,
+            total_months=total_months
+        )
+        intern.assignments = {9: 'IVF', 10: station_key}
+        interns.append(intern)
+    
+    analysis = BottleneckAnalyzer(interns, lookahead_months=1).analyze()
+    print(f"✓ {analysis['bottlenecks_found']} bottleneck months, {analysis['critical_count']} critical")
+    print()
+    
+    def no_coverage(station, required):
+        return {'type': 'no_coverage', 'severity': 'critical', 'station': station,
+                'current': 0, 'required': required, 'deficit': required}
+    
+    # Out-of-range stations in order of first appearance, then uncovered
+    # stations in config order
+    assert analysis['bottlenecks'] == [{
+        'month': 10,
+        'issues': [
+            {'type': 'overstaffed', 'severity': 'warning', 'station': 'גינקולוגיה א',
+             'current': 3, 'maximum': 2, 'excess': 1,
+             'interns': ["Intern G1", "Intern G2", "Intern G3"]},
+            {'type': 'understaffed', 'severity': 'warning', 'station': 'חדר לידה',
+             'current': 1, 'required': 3, 'deficit': 2,
+             'interns': ["Intern B1"]},
+            no_coverage('הריון בסיכון א', 1),
+            no_coverage('הריון בסיכון ב', 1),
+            no_coverage('גינקולוגיה ב', 1),
+            no_coverage('מיון יולדות', 2),
+            no_coverage('מיון נשים', 1),
+            no_coverage('א.יום גינקולוגי', 1),
+            no_coverage('א.יום מיילדותי', 1),
+            no_coverage('א. יום מיילד', 1),
+            no_coverage('אשפוז יום', 1),
+        ]
+    }]
+
+
 if __name__ == "__main__":
     # Test Excel I/O
     test_excel_io()